@@ -1,221 +1,263 @@
+import hashlib
+import inspect
+import sys
+import zipfile
 import pandas as pd
+import matplotlib as mpl
+# Render headless unless an interactive window was asked for
+if '--show' not in sys.argv:
+    mpl.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.ticker import FixedFormatter, FixedLocator
+from pathlib import Path
 
-# Read data
-df = pd.read_csv('benchmark_results.csv')
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow not installed; the Feather cache is skipped
+    pa = None
 
-print("\n" + "="*70)
-print("DATA VERIFICATION")
-print("="*70)
-print(df.to_string(index=False))
-print("="*70 + "\n")
+csv_path = Path('benchmark_results.csv')
+feather_path = Path('benchmark_results.feather')
+npz_path = Path('benchmark_results.npz')
+iter_sizes = [10000, 20000, 30000]
+# Distributed configurations, in the column order of the derived matrices;
+# every per-configuration array, label and color follows this list
+dist_configs = [('Distributed-Local', 2), ('Distributed-Local', 4),
+                ('Distributed-MultiVM', 6), ('Distributed-MultiVM', 8)]
+
+
+def read_benchmarks(path):
+    """Parse the benchmark CSV (explicit dtypes skip inference; Distance is not plotted)."""
+    return pd.read_csv(path,
+                       usecols=['Implementation', 'Graph_Size', 'Processes', 'Time_ms', 'Iterations'],
+                       dtype={'Implementation': 'category', 'Graph_Size': 'int32', 'Processes': 'int8',
+                              'Time_ms': 'float32', 'Iterations': 'float32'},
+                       na_values=['N/A'])
+
+
+def derive_arrays(df):
+    """Pivot the benchmark rows into the arrays the plots are drawn from."""
+    graph_sizes = np.unique(df['Graph_Size'].to_numpy())
+
+    # Pivot once: (Implementation, Processes) columns indexed by graph size.
+    # Times are stored as float32; do the ratio math in float64.
+    t = df.pivot_table(index='Graph_Size', columns=['Implementation', 'Processes'],
+                       values='Time_ms', observed=True).reindex(graph_sizes).astype('float64')
+    it = df.pivot_table(index='Graph_Size', columns=['Implementation', 'Processes'],
+                        values='Iterations', observed=True)
+
+    seq_times = t[('Sequential', 1)].to_numpy()
+
+    # Derived metrics for Plots 2-4, computed once: rows are graph sizes,
+    # columns the distributed configurations in dist_configs order
+    dist_mat = t[dist_configs].to_numpy()
+    np_arr = np.array([p for _, p in dist_configs])
+    speedup = np.divide(seq_times[:, None], dist_mat,
+                        out=np.zeros_like(dist_mat, dtype=float), where=dist_mat > 0)
+    overhead = np.divide(dist_mat, seq_times[:, None],
+                         out=np.zeros_like(dist_mat, dtype=float), where=seq_times[:, None] > 0)
+    eff = speedup / np_arr[None, :] * 100
+
+    # One row per Plot 1 configuration: Sequential, then dist_configs
+    heights = np.vstack([seq_times, dist_mat.T])
+
+    iter_counts = it.reindex(index=iter_sizes, columns=pd.MultiIndex.from_tuples(dist_configs))
+    # Rows match Plot 1's configurations; Sequential has no iterations tracked
+    iter_mat = np.vstack([np.zeros(len(iter_sizes), dtype=int),
+                          iter_counts.fillna(0).astype(int).to_numpy().T])
+    return {'graph_sizes': graph_sizes, 'heights': heights, 'speedup': speedup,
+            'overhead': overhead, 'eff': eff, 'iter_mat': iter_mat}
+
+
+def source_hash(*funcs):
+    """Digest of the functions' source, so editing them invalidates the caches."""
+    return hashlib.sha1(''.join(inspect.getsource(f) for f in funcs).encode()).hexdigest()
+
+
+# The Feather cache of the parsed CSV is valid for this exact CSV (mtime and
+# size) and parsing code; the .npz of derived arrays additionally depends on
+# the derivation code and settings. Reruns that only change plot styling skip
+# loading and the numeric pipeline entirely, and edits to derive_arrays still
+# reuse the parsed Feather data.
+csv_stat = csv_path.stat()
+csv_key = repr((csv_stat.st_mtime_ns, csv_stat.st_size, source_hash(read_benchmarks)))
+cache_key = repr((csv_key, source_hash(derive_arrays), iter_sizes, dist_configs))
+array_names = ['graph_sizes', 'heights', 'speedup', 'overhead', 'eff', 'iter_mat']
+arrays = None
+if npz_path.exists():
+    try:
+        with np.load(npz_path) as data:
+            if data['key'].item() == cache_key:
+                arrays = {k: data[k] for k in array_names}
+    except (KeyError, ValueError, OSError, zipfile.BadZipFile):
+        arrays = None  # unreadable or incomplete cache: recompute
+
+# Read data, reusing the Feather cache when its key matches
+if arrays is None or '-v' in sys.argv:
+    df = None
+    if pa is not None and feather_path.exists():
+        try:
+            table = feather.read_table(feather_path)
+            if (table.schema.metadata or {}).get(b'csv_key') == csv_key.encode():
+                df = table.to_pandas()
+        except (ValueError, OSError):
+            pass
+    if df is None:
+        df = read_benchmarks(csv_path)
+        if pa is not None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata({**table.schema.metadata,
+                                                   b'csv_key': csv_key.encode()})
+            feather.write_feather(table, feather_path)
+
+# Full table dump only on request (-v); formatting every cell is costly on large CSVs
+if '-v' in sys.argv:
+    print("\n" + "="*70)
+    print("DATA VERIFICATION")
+    print("="*70)
+    print(df.to_string(index=False))
+    print("="*70 + "\n")
+
+if arrays is None:
+    arrays = derive_arrays(df)
+    np.savez(npz_path, key=cache_key, **arrays)
+graph_sizes, heights, speedup, overhead, eff, iter_mat = (arrays[k] for k in array_names)
+size_labels = [f'{s//1000}K' for s in graph_sizes]
+
+# Light horizontal grid on every Axes, applied at creation time; the previous
+# settings are restored once the figure is closed
+grid_rc = {'axes.grid': True, 'axes.grid.axis': 'y', 'grid.alpha': 0.3}
+saved_rc = {k: plt.rcParams[k] for k in grid_rc}
+plt.rcParams.update(grid_rc)
 
 # Create figure with subplots
-fig = plt.figure(figsize=(18, 12))
-gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+# Constrained layout places the axes while drawing, so savefig needs no
+# separate bbox_inches='tight' pass over every artist
+fig = plt.figure(figsize=(18, 12), layout='constrained')
+gs = fig.add_gridspec(3, 3)
 
 fig.suptitle('Distributed Pathfinding: Performance Analysis\n(Local vs Multi-VM Comparison)', 
-             fontsize=16, fontweight='bold', y=0.98)
+             fontsize=16, fontweight='bold')
+
+# Color scheme per (Implementation, Processes), parsed to RGBA once instead of
+# on every bar call
+colors = {k: mpl.colors.to_rgba(v) for k, v in {
+    ('Sequential', 1): '#2E86AB',
+    ('Distributed-Local', 2): '#A23B72',
+    ('Distributed-Local', 4): '#F18F01',
+    ('Distributed-MultiVM', 6): '#06A77D',
+    ('Distributed-MultiVM', 8): '#C73E1D'
+}.items()}
+impl_names = {'Distributed-Local': 'Local', 'Distributed-MultiVM': 'Multi-VM'}
 
-# Color scheme
-colors = {
-    'Sequential': '#2E86AB',
-    'Local-2': '#A23B72',
-    'Local-4': '#F18F01',
-    'MultiVM-6': '#06A77D',
-    'MultiVM-8': '#C73E1D'
-}
+# Plot 1 / iteration-plot rows: Sequential, then dist_configs
+labels = ['Sequential'] + [f'{impl_names[impl]} {p}P' for impl, p in dist_configs]
+bar_rgba = [colors[('Sequential', 1)]] + [colors[c] for c in dist_configs]
+# Column indices into the derived matrices for Plots 2 and 3
+local_cols = [i for i, (impl, _) in enumerate(dist_configs) if impl == 'Distributed-Local']
+multivm_cols = [i for i, (impl, _) in enumerate(dist_configs) if impl == 'Distributed-MultiVM']
+
+
+def decade_ticks(values):
+    """Powers of ten spanning the positive values, for a fixed log-axis locator."""
+    values = np.asarray(values)
+    values = values[values > 0]
+    return 10.0 ** np.arange(np.floor(np.log10(values.min())),
+                             np.ceil(np.log10(values.max())) + 1)
 
-graph_sizes = df['Graph_Size'].unique()
-graph_sizes.sort()
 
 #Plot 1: Execution Time Comparison 
 ax1 = fig.add_subplot(gs[0, :])
-x = np.arange(len(graph_sizes))
+x = np.arange(len(graph_sizes), dtype=np.int32)
 width = 0.15
 
-# Sequential
-seq_times = [df[(df['Implementation'] == 'Sequential') & 
-                (df['Graph_Size'] == s)]['Time_ms'].values[0] for s in graph_sizes]
-ax1.bar(x - 2*width, seq_times, width, label='Sequential', color=colors['Sequential'])
-
-# Local 2P
-local2_times = [df[(df['Implementation'] == 'Distributed-Local') & 
-                   (df['Graph_Size'] == s) & 
-                   (df['Processes'] == 2)]['Time_ms'].values[0] for s in graph_sizes]
-ax1.bar(x - width, local2_times, width, label='Local 2P', color=colors['Local-2'])
-
-# Local 4P
-local4_times = [df[(df['Implementation'] == 'Distributed-Local') & 
-                   (df['Graph_Size'] == s) & 
-                   (df['Processes'] == 4)]['Time_ms'].values[0] for s in graph_sizes]
-ax1.bar(x, local4_times, width, label='Local 4P', color=colors['Local-4'])
-
-# Multi-VM 6P
-multi6_times = [df[(df['Implementation'] == 'Distributed-MultiVM') & 
-                   (df['Graph_Size'] == s) & 
-                   (df['Processes'] == 6)]['Time_ms'].values[0] for s in graph_sizes]
-ax1.bar(x + width, multi6_times, width, label='Multi-VM 6P', color=colors['MultiVM-6'])
-
-# Multi-VM 8P
-multi8_times = [df[(df['Implementation'] == 'Distributed-MultiVM') & 
-                   (df['Graph_Size'] == s) & 
-                   (df['Processes'] == 8)]['Time_ms'].values[0] for s in graph_sizes]
-ax1.bar(x + 2*width, multi8_times, width, label='Multi-VM 8P', color=colors['MultiVM-8'])
+offsets = (np.arange(len(labels)) - (len(labels) - 1) / 2) * width
+for i in range(len(labels)):
+    ax1.bar(x + offsets[i], heights[i], width, label=labels[i], color=bar_rgba[i])
 
 ax1.set_xlabel('Graph Size (nodes)', fontsize=11)
 ax1.set_ylabel('Execution Time (ms)', fontsize=11)
 ax1.set_title('Execution Time: Local vs Multi-VM', fontsize=12, fontweight='bold')
-ax1.set_xticks(x)
-ax1.set_xticklabels([f'{s//1000}K' for s in graph_sizes])
+ax1.xaxis.set_major_locator(FixedLocator(x))
+ax1.xaxis.set_major_formatter(FixedFormatter(size_labels))
 ax1.legend(fontsize=9)
-ax1.grid(True, alpha=0.3, axis='y')
 ax1.set_yscale('log')
+# Fixed decade ticks instead of a LogLocator search on every draw
+ax1.yaxis.set_major_locator(FixedLocator(decade_ticks(heights)))
 
 #Plot 2: Local Speedup Analysis
 ax2 = fig.add_subplot(gs[1, 0])
-x = np.arange(len(graph_sizes))
+x = np.arange(len(graph_sizes), dtype=np.int32)
 width = 0.35
 
-speedups_2p = []
-speedups_4p = []
-for size in graph_sizes:
-    seq_time = df[(df['Implementation'] == 'Sequential') & 
-                  (df['Graph_Size'] == size)]['Time_ms'].values[0]
-    time_2p = df[(df['Implementation'] == 'Distributed-Local') & 
-                 (df['Graph_Size'] == size) & 
-                 (df['Processes'] == 2)]['Time_ms'].values[0]
-    time_4p = df[(df['Implementation'] == 'Distributed-Local') & 
-                 (df['Graph_Size'] == size) & 
-                 (df['Processes'] == 4)]['Time_ms'].values[0]
-    speedups_2p.append(seq_time / time_2p if time_2p > 0 else 0)
-    speedups_4p.append(seq_time / time_4p if time_4p > 0 else 0)
-
-ax2.bar(x - width/2, speedups_2p, width, label='2 Processes', color=colors['Local-2'])
-ax2.bar(x + width/2, speedups_4p, width, label='4 Processes', color=colors['Local-4'])
+for j, col in enumerate(local_cols):
+    ax2.bar(x + (j - (len(local_cols) - 1) / 2) * width, speedup[:, col], width,
+            label=f'{dist_configs[col][1]} Processes', color=colors[dist_configs[col]])
 ax2.axhline(y=1, color='gray', linestyle='--', alpha=0.5, label='Baseline')
 ax2.set_xlabel('Graph Size', fontsize=10)
 ax2.set_ylabel('Speedup Factor', fontsize=10)
 ax2.set_title('Local Execution Speedup', fontsize=11, fontweight='bold')
-ax2.set_xticks(x)
-ax2.set_xticklabels([f'{s//1000}K' for s in graph_sizes])
+ax2.xaxis.set_major_locator(FixedLocator(x))
+ax2.xaxis.set_major_formatter(FixedFormatter(size_labels))
 ax2.legend(fontsize=8)
-ax2.grid(True, alpha=0.3, axis='y')
 
 #Plot 3: Multi-VM Overhead
-ax3 = fig.add_subplot(gs[1, 1])
-x = np.arange(len(graph_sizes))
+# Plots 2-4 share the graph-size x axis, so its ticks are laid out once (on ax2)
+ax3 = fig.add_subplot(gs[1, 1], sharex=ax2)
+x = np.arange(len(graph_sizes), dtype=np.int32)
 width = 0.35
 
-overhead_6p = []
-overhead_8p = []
-for size in graph_sizes:
-    seq_time = df[(df['Implementation'] == 'Sequential') & 
-                  (df['Graph_Size'] == size)]['Time_ms'].values[0]
-    time_6p = df[(df['Implementation'] == 'Distributed-MultiVM') & 
-                 (df['Graph_Size'] == size) & 
-                 (df['Processes'] == 6)]['Time_ms'].values[0]
-    time_8p = df[(df['Implementation'] == 'Distributed-MultiVM') & 
-                 (df['Graph_Size'] == size) & 
-                 (df['Processes'] == 8)]['Time_ms'].values[0]
-    overhead_6p.append(time_6p / seq_time if seq_time > 0 else 0)
-    overhead_8p.append(time_8p / seq_time if seq_time > 0 else 0)
-
-ax3.bar(x - width/2, overhead_6p, width, label='6 Processes', color=colors['MultiVM-6'])
-ax3.bar(x + width/2, overhead_8p, width, label='8 Processes', color=colors['MultiVM-8'])
+for j, col in enumerate(multivm_cols):
+    ax3.bar(x + (j - (len(multivm_cols) - 1) / 2) * width, overhead[:, col], width,
+            label=f'{dist_configs[col][1]} Processes', color=colors[dist_configs[col]])
 ax3.axhline(y=1, color='gray', linestyle='--', alpha=0.5, label='Sequential Baseline')
 ax3.set_xlabel('Graph Size', fontsize=10)
 ax3.set_ylabel('Slowdown Factor', fontsize=10)
 ax3.set_title('Multi-VM Communication Overhead', fontsize=11, fontweight='bold')
-ax3.set_xticks(x)
-ax3.set_xticklabels([f'{s//1000}K' for s in graph_sizes])
 ax3.legend(fontsize=8)
-ax3.grid(True, alpha=0.3, axis='y')
 ax3.set_yscale('log')
+# Include the y=1 baseline in the tick span
+ax3.yaxis.set_major_locator(FixedLocator(decade_ticks(np.append(overhead[:, multivm_cols], 1))))
 
 #  Plot 4: Parallel Efficiency 
-ax4 = fig.add_subplot(gs[1, 2])
-x = np.arange(len(graph_sizes))
+ax4 = fig.add_subplot(gs[1, 2], sharex=ax2)
+x = np.arange(len(graph_sizes), dtype=np.int32)
 width = 0.2
 
-for i, (np_val, label, color) in enumerate([(2, '2P Local', 'Local-2'), 
-                                              (4, '4P Local', 'Local-4'),
-                                              (6, '6P Multi-VM', 'MultiVM-6'),
-                                              (8, '8P Multi-VM', 'MultiVM-8')]):
-    efficiencies = []
-    for size in graph_sizes:
-        seq_time = df[(df['Implementation'] == 'Sequential') & 
-                      (df['Graph_Size'] == size)]['Time_ms'].values[0]
-        
-        if np_val <= 4:
-            dist_time = df[(df['Implementation'] == 'Distributed-Local') & 
-                          (df['Graph_Size'] == size) & 
-                          (df['Processes'] == np_val)]['Time_ms'].values[0]
-        else:
-            dist_time = df[(df['Implementation'] == 'Distributed-MultiVM') & 
-                          (df['Graph_Size'] == size) & 
-                          (df['Processes'] == np_val)]['Time_ms'].values[0]
-        
-        speedup = seq_time / dist_time if dist_time > 0 else 0
-        efficiency = (speedup / np_val) * 100
-        efficiencies.append(efficiency)
-    
-    ax4.bar(x + (i-1.5)*width, efficiencies, width, label=label, color=colors[color])
+for i, (impl, p) in enumerate(dist_configs):
+    ax4.bar(x + (i - (len(dist_configs) - 1) / 2) * width, eff[:, i], width,
+            label=f'{p}P {impl_names[impl]}', color=colors[(impl, p)])
 
 ax4.axhline(y=100, color='gray', linestyle='--', alpha=0.5, label='100% Efficient')
 ax4.set_xlabel('Graph Size', fontsize=10)
 ax4.set_ylabel('Efficiency (%)', fontsize=10)
 ax4.set_title('Parallel Efficiency Comparison', fontsize=11, fontweight='bold')
-ax4.set_xticks(x)
-ax4.set_xticklabels([f'{s//1000}K' for s in graph_sizes])
 ax4.legend(fontsize=7)
-ax4.grid(True, alpha=0.3, axis='y')
-
-# Plot 5-7: Iteration Counts
-for idx, size in enumerate([10000, 20000, 30000]):
-    ax = fig.add_subplot(gs[2, idx])
-    
-    df_size = df[df['Graph_Size'] == size]
-    
-    configs = ['Seq', 'L-2P', 'L-4P', 'MV-6P', 'MV-8P']
-    iterations = []
-    
-    # Sequential (no iterations tracked)
-    iterations.append(0)
-    
-    # Local 2P
-    iter_val = df_size[(df_size['Implementation'] == 'Distributed-Local') & 
-                       (df_size['Processes'] == 2)]['Iterations'].values
-    iterations.append(int(iter_val[0]) if len(iter_val) > 0 else 0)
-    
-    # Local 4P
-    iter_val = df_size[(df_size['Implementation'] == 'Distributed-Local') & 
-                       (df_size['Processes'] == 4)]['Iterations'].values
-    iterations.append(int(iter_val[0]) if len(iter_val) > 0 else 0)
-    
-    # Multi-VM 6P
-    iter_val = df_size[(df_size['Implementation'] == 'Distributed-MultiVM') & 
-                       (df_size['Processes'] == 6)]['Iterations'].values
-    iterations.append(int(iter_val[0]) if len(iter_val) > 0 else 0)
-    
-    # Multi-VM 8P
-    iter_val = df_size[(df_size['Implementation'] == 'Distributed-MultiVM') & 
-                       (df_size['Processes'] == 8)]['Iterations'].values
-    iterations.append(int(iter_val[0]) if len(iter_val) > 0 else 0)
-    
-    bars = ax.bar(configs, iterations, color=['#2E86AB', '#A23B72', '#F18F01', '#06A77D', '#C73E1D'])
-    ax.set_title(f'{size//1000}K Nodes - Iterations', fontsize=11, fontweight='bold')
-    ax.set_ylabel('Iterations', fontsize=10)
-    ax.grid(True, alpha=0.3, axis='y')
-    
+
+# Plot 5: Iteration Counts
+ax5 = fig.add_subplot(gs[2, :])
+x = np.arange(len(iter_sizes), dtype=np.int32)
+width = 0.15
+
+for i in range(len(labels)):
+    bars = ax5.bar(x + offsets[i], iter_mat[i], width, label=labels[i], color=bar_rgba[i])
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        if height > 0:
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}', ha='center', va='bottom', fontsize=9)
+    ax5.bar_label(bars, labels=[f'{h}' if h > 0 else '' for h in iter_mat[i]],
+                  fontsize=9, padding=1)
+
+ax5.set_xlabel('Graph Size (nodes)', fontsize=10)
+ax5.set_ylabel('Iterations', fontsize=10)
+ax5.set_title('Iteration Counts', fontsize=11, fontweight='bold')
+ax5.xaxis.set_major_locator(FixedLocator(x))
+ax5.xaxis.set_major_formatter(FixedFormatter([f'{s//1000}K' for s in iter_sizes]))
+ax5.legend(fontsize=8)
+ax5.margins(y=0.1)
 
-plt.savefig('performance_analysis.png', dpi=300, bbox_inches='tight')
+fig.savefig('performance_analysis.png', dpi=150)
 print("Visualization saved as 'performance_analysis.png'\n")
-plt.show()
+if '--show' in sys.argv:
+    plt.show()
+plt.close(fig)
+plt.rcParams.update(saved_rc)